@@ -1,6 +1,8 @@
+from concurrent.futures.thread import ThreadPoolExecutor
 import json
 import os
 import pathlib
+import shutil
 import subprocess
 import sys
 from typing import List, Optional, Tuple, cast
@@ -271,7 +273,7 @@ def generate_mpc_configs(
             "--desired-presignatures-to-buffer",
             str(presignatures_to_buffer),
         )
-    subprocess.run(cmd)
+    subprocess.run(cmd, check=True)
 
     candidates = []
     with open(pathlib.Path(dot_near / "participants.json")) as file:
@@ -337,12 +339,9 @@ def move_mpc_configs(observers: List[LocalNode]):
     for idx, observer in enumerate(observers):
         mpc_config_dir = dot_near / str(idx)
         for fname in os.listdir(mpc_config_dir):
-            subprocess.run(
-                (
-                    "mv",
-                    os.path.join(mpc_config_dir, fname),
-                    observer.node_dir,
-                )
+            shutil.move(
+                os.path.join(mpc_config_dir, fname),
+                os.path.join(observer.node_dir, fname),
             )
 
 
@@ -354,14 +353,20 @@ def start_cluster_with_mpc(
     presignatures_to_buffer=None,
     start_mpc_nodes=True,
 ):
-    validators, observers = start_neard_cluster_with_cleanup(
-        num_validators,
-        num_mpc_nodes,
-    )
-
-    candidates = generate_mpc_configs(
-        num_mpc_nodes, num_respond_aks, presignatures_to_buffer
-    )
+    # Generating the MPC configs only writes to `dot_near/<idx>` and
+    # `dot_near/participants.json`, so it can overlap with the neard startup.
+    with ThreadPoolExecutor(max_workers=1) as executor:
+        candidates_future = executor.submit(
+            generate_mpc_configs,
+            num_mpc_nodes,
+            num_respond_aks,
+            presignatures_to_buffer,
+        )
+        validators, observers = start_neard_cluster_with_cleanup(
+            num_validators,
+            num_mpc_nodes,
+        )
+        candidates = candidates_future.result()
 
     move_mpc_configs(observers)
 
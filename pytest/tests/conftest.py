@@ -140,6 +140,14 @@ def compile_mpc_contract(request):
         compile_contract_common(contracts.MPC_CONTRACT_PACKAGE_NAME)
 
 
+@pytest.fixture(scope="session")
+def mpc_contract(compile_mpc_contract) -> bytearray:
+    """
+    Loads the compiled mpc-contract once per session, after `compile_mpc_contract` has run.
+    """
+    return contracts.load_mpc_contract()
+
+
 @pytest.fixture(scope="session")
 def compile_parallel_contract(request):
     """
@@ -28,17 +28,16 @@ import os
 
 sys.path.append(str(pathlib.Path(__file__).resolve().parents[1]))
 from common_lib import shared, signature
-from common_lib.contracts import load_mpc_contract
 
 
-def test_interactive_cluster():
+def test_interactive_cluster(mpc_contract: bytearray):
     if os.environ.get("INTERACTIVE_PYTEST") != "1":
         pytest.skip(
             "Only used for manual interactive testing. Set INTERACTIVE_PYTEST=1 to run."
         )
     num_respond_access_keys = 5
     cluster, mpc_nodes = shared.start_cluster_with_mpc(
-        2, 6, num_respond_access_keys, load_mpc_contract()
+        2, 6, num_respond_access_keys, mpc_contract
     )
     cluster.init_cluster(mpc_nodes, 4)
     print(
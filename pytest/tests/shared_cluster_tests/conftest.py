@@ -5,11 +5,11 @@ import atexit
 
 sys.path.append(str(pathlib.Path(__file__).resolve().parents[2]))
 
-from common_lib import shared, contracts, contract_state
+from common_lib import shared, contract_state
 
 
 @pytest.fixture(scope="package")
-def shared_cluster():
+def shared_cluster(mpc_contract: bytearray):
     """
     Spins up a cluster with three nodes per test, initializes the contract and adds
     domains. Returns the cluster in a running state.
@@ -18,7 +18,7 @@ def shared_cluster():
         2,
         2,
         1,
-        contracts.load_mpc_contract(),
+        mpc_contract,
     )
     cluster.init_cluster(mpc_nodes, 2)
     cluster.wait_for_state(contract_state.ProtocolState.RUNNING)
@@ -22,7 +22,7 @@ from common_lib.migration_state import (
 )
 from common_lib.shared.mpc_cluster import MpcCluster
 from common_lib.shared.mpc_node import MpcNode
-from common_lib import shared
+from common_lib import constants, shared
 
 
 @pytest.mark.no_atexit_cleanup
@@ -107,29 +107,42 @@ def verify_migration_endpoint(
     assert_web_endpiont_match(port, expected_migrations)
 
 
+def wait_until(predicate, timeout: float, interval: float = 0.25) -> bool:
+    """
+    Polls `predicate` until it returns True or `timeout` seconds have passed.
+    Returns the last result of `predicate`.
+    """
+    deadline = time.monotonic() + timeout
+    while time.monotonic() < deadline:
+        if predicate():
+            return True
+        time.sleep(interval)
+    return predicate()
+
+
 def assert_web_endpiont_match(port: int, expected_migrations: MigrationState):
-    max_attempts: int = 10
-    for attempt in range(max_attempts):
+    last_response: str = ""
+
+    def web_endpoint_matches() -> bool:
+        nonlocal last_response
         response = requests.get(f"http://localhost:{port}/debug/migrations")
+        last_response = response.text
         (_, contract_btree_map) = json.loads(response.text)
-        res = parse_migration_state(contract_btree_map)
-        if res == expected_migrations:
-            break
-        else:
-            assert attempt + 1 < max_attempts, (
-                f"Expected {expected_migrations}, found: {response.text}"
-            )
-            time.sleep(1)
+        return parse_migration_state(contract_btree_map) == expected_migrations
+
+    assert wait_until(web_endpoint_matches, timeout=constants.SHORT_TIMEOUT), (
+        f"Expected {expected_migrations}, found: {last_response}"
+    )
 
 
 def assert_contract_match(cluster: MpcCluster, expected_migrations: MigrationState):
-    max_attempts: int = 10
-    for attempt in range(max_attempts):
+    contract_migrations = None
+
+    def contract_matches() -> bool:
+        nonlocal contract_migrations
         contract_migrations = cluster.get_migrations()
-        if expected_migrations == contract_migrations:
-            break
-        else:
-            assert attempt + 1 < max_attempts, (
-                f"Failed to get expected migrations state expected: {expected_migrations}, found: {contract_migrations}"
-            )
-            time.sleep(1)
+        return contract_migrations == expected_migrations
+
+    assert wait_until(contract_matches, timeout=constants.SHORT_TIMEOUT), (
+        f"Failed to get expected migrations state expected: {expected_migrations}, found: {contract_migrations}"
+    )
@@ -7,14 +7,13 @@ sys.path.append(str(pathlib.Path(__file__).resolve().parents[1]))
 
 from common_lib.shared.transaction_status import assert_txn_execution_error
 from common_lib import shared
-from common_lib.contracts import load_mpc_contract
 from common_lib.contract_state import (
     ProtocolState,
     RunningProtocolState,
 )
 
 
-def test_cancellation_of_key_resharing():
+def test_cancellation_of_key_resharing(mpc_contract: bytearray):
     """
     Tests the flow of cancellation of key resharing by calling the `vote_cancel_resharing` method on the contract.
 
@@ -37,7 +36,7 @@ def test_cancellation_of_key_resharing():
         initial_running_nodes,
         total_nodes,
         1,
-        load_mpc_contract(),
+        mpc_contract,
     )
     initial_running_nodes = mpc_nodes[:initial_running_nodes]
     all_participants = mpc_nodes[:total_nodes]
@@ -15,10 +15,9 @@ from common_lib.contract_state import ProtocolState
 
 sys.path.append(str(pathlib.Path(__file__).resolve().parents[1]))
 from common_lib import shared
-from common_lib.contracts import load_mpc_contract
 
 
-def test_single_domain():
+def test_single_domain(mpc_contract: bytearray):
     """
     Tests single-domain key generation and resharing.
 
@@ -29,7 +28,7 @@ def test_single_domain():
 
     Signature requests are sent after each resharing to verify liveness.
     """
-    cluster, mpc_nodes = shared.start_cluster_with_mpc(2, 4, 1, load_mpc_contract())
+    cluster, mpc_nodes = shared.start_cluster_with_mpc(2, 4, 1, mpc_contract)
     mpc_nodes[0].reserve_key_event_attempt(0, 0, 0)
     mpc_nodes[0].reserve_key_event_attempt(0, 0, 1)
     # start with 2 nodes
@@ -82,7 +81,7 @@ def test_single_domain():
     cluster.send_and_await_ckd_requests(1)
 
 
-def test_multi_domain():
+def test_multi_domain(mpc_contract: bytearray):
     """
     Tests multi-domain key generation and resharing.
 
@@ -91,7 +90,7 @@ def test_multi_domain():
 
     Afterwards, it adds another domain but cancels the key generation before completion.
     """
-    cluster, mpc_nodes = shared.start_cluster_with_mpc(2, 4, 1, load_mpc_contract())
+    cluster, mpc_nodes = shared.start_cluster_with_mpc(2, 4, 1, mpc_contract)
 
     # start with 2 nodes
     cluster.init_cluster(participants=mpc_nodes[:2], threshold=2)
@@ -19,14 +19,13 @@ from common_lib.shared import MpcCluster, metrics
 
 sys.path.append(str(pathlib.Path(__file__).resolve().parents[1]))
 from common_lib import shared
-from common_lib.contracts import load_mpc_contract
 from common_lib.constants import INDEXER_MAX_HEIGHT_DIFF, TIMEOUT
 
 PRESIGNATURES_TO_BUFFER = 8
 
 
 @pytest.fixture(scope="module")
-def lost_assets_cluster():
+def lost_assets_cluster(mpc_contract: bytearray):
     """
     Spins up a cluster with three nodes, initializes the contract and adds domains. Returns the cluster in a running state.
     """
@@ -34,7 +33,7 @@ def lost_assets_cluster():
         2,
         3,
         1,
-        load_mpc_contract(),
+        mpc_contract,
         presignatures_to_buffer=PRESIGNATURES_TO_BUFFER,
     )
     cluster.init_cluster(mpc_nodes, 2)
@@ -21,12 +21,11 @@ from common_lib.contract_state import ProtocolState
 
 sys.path.append(str(pathlib.Path(__file__).resolve().parents[1]))
 from common_lib import shared
-from common_lib.contracts import load_mpc_contract
 
 
-def test_threshold_from_previous_running_state_is_maintained():
+def test_threshold_from_previous_running_state_is_maintained(mpc_contract: bytearray):
     # Have the nodes disabled
-    cluster, mpc_nodes = shared.start_cluster_with_mpc(2, 4, 1, load_mpc_contract())
+    cluster, mpc_nodes = shared.start_cluster_with_mpc(2, 4, 1, mpc_contract)
 
     cluster.init_cluster(participants=mpc_nodes[:2], threshold=2)
 
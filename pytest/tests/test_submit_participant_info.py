@@ -8,17 +8,16 @@ import pathlib
 
 sys.path.append(str(pathlib.Path(__file__).resolve().parents[1]))
 from common_lib import shared
-from common_lib.contracts import load_mpc_contract
 
 
-def test_submit_participant_info_endpoint():
+def test_submit_participant_info_endpoint(mpc_contract: bytearray):
     initial_participants = 2
     total_nodes = 4
     cluster, mpc_nodes = shared.start_cluster_with_mpc(
         2,
         total_nodes,
         1,
-        load_mpc_contract(),
+        mpc_contract,
     )
     cluster.init_cluster(mpc_nodes[:initial_participants], 2)
 